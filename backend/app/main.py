@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.staticfiles import StaticFiles
 from starlette.responses import FileResponse
 import os
@@ -17,6 +18,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Timeseries/hyetograph payloads are long, repetitive JSON arrays that
+# compress well; small responses are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # API Routers
 app.include_router(percent_capture.router, prefix="/api/percent-capture", tags=["percent-capture"])
 app.include_router(design_storm.router, prefix="/api/design-storm", tags=["design-storm"])
@@ -33,7 +33,9 @@ def generate(req: DesignStormRequest):
     x = np.clip(t / max(tp, 1e-6), 0, 1)
     y = np.clip((1 - t / max(T, 1e-6)) / max(1 - tp / max(T, 1e-6), 1e-6), 0, 1)
 
-    intensity_shape = np.power(x, a - 1) * np.power(y, b - 1)
+    # evaluate in place on the clipped buffers rather than allocating temporaries
+    intensity_shape = np.power(x, a - 1, out=x)
+    intensity_shape *= np.power(y, b - 1, out=y)
     intensity_shape[0] = 0.0
     if intensity_shape.sum() <= 0:
         intensity_shape = np.ones_like(intensity_shape)
@@ -42,7 +44,7 @@ def generate(req: DesignStormRequest):
     incr = intensity_shape / intensity_shape.sum() * req.total_depth_inches
     cum = incr.cumsum().tolist()
     return DesignStormResponse(
-        time_minutes=t.astype(int).tolist(),
+        time_minutes=t.tolist(),
         incremental_inches=incr.tolist(),
         cumulative_inches=cum,
     )
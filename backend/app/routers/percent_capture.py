@@ -1,6 +1,5 @@
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
-import pandas as pd
 
 router = APIRouter()
 
@@ -1,9 +1,13 @@
 from fastapi import APIRouter
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
+import numpy as np
 import pandas as pd
 
 router = APIRouter()
 
+_AGGREGATIONS = {"mean", "sum", "min", "max"}
+
 class ExtractRequest(BaseModel):
     timestamps: list[str] = Field(..., description="ISO8601 timestamps")
     values: list[float] = Field(..., description="Timeseries values")
@@ -12,27 +16,48 @@ class ExtractRequest(BaseModel):
 
 class ExtractResponse(BaseModel):
     timestamps: list[str]
-    values: list[float]
+    values: list[float | None]  # None for empty resample bins
+
+def _isoformat(index: pd.Index) -> list[str]:
+    # np.datetime_as_string formats the whole array in C; it matches
+    # Timestamp.isoformat() only for tz-naive, whole-second stamps without NaT.
+    if (
+        isinstance(index, pd.DatetimeIndex)
+        and index.tz is None
+        and not index.hasnans
+        and not (index.microsecond | index.nanosecond).any()
+    ):
+        return np.datetime_as_string(index.values, unit="s").tolist()
+    return [t.isoformat() for t in index]
+
+def _parse_timestamps(timestamps: list[str]) -> pd.DatetimeIndex:
+    # ISO8601 goes straight to pandas' C parser; anything else (e.g.
+    # "1/2/2025 00:00") falls back to the inferred-format parse.
+    try:
+        return pd.to_datetime(timestamps, format="ISO8601")
+    except ValueError:
+        return pd.to_datetime(timestamps)
 
 @router.post("/extract", response_model=ExtractResponse)
 def extract(req: ExtractRequest):
     if len(req.timestamps) != len(req.values):
         raise ValueError("timestamps and values length mismatch")
-    df = pd.DataFrame({"ts": pd.to_datetime(req.timestamps), "v": req.values}).set_index("ts").sort_index()
+    index = _parse_timestamps(req.timestamps)
+    df = pd.DataFrame({"v": req.values}, index=index)
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
 
     if req.resample_minutes:
         rule = f"{req.resample_minutes}min"
-        if req.agg == "sum":
-            df = df.resample(rule).sum()
-        elif req.agg == "min":
-            df = df.resample(rule).min()
-        elif req.agg == "max":
-            df = df.resample(rule).max()
-        else:
-            df = df.resample(rule).mean()
-
-    df = df.reset_index()
-    return ExtractResponse(
-        timestamps=[t.isoformat() for t in df["ts"].tolist()],
-        values=[float(x) for x in df["v"].tolist()],
+        how = req.agg if req.agg in _AGGREGATIONS else "mean"
+        df = df.resample(rule).agg(how)
+
+    resp = ExtractResponse(
+        timestamps=_isoformat(df.index),
+        values=df["v"].to_numpy(dtype=float).tolist(),
     )
+    # Returning a Response skips FastAPI re-validating the model and walking it
+    # through jsonable_encoder + json.dumps, which dominates on long series.
+    # response_model therefore only documents the schema; nothing validates the
+    # payload on the way out. Empty resample bins (NaN) serialise as null.
+    return Response(resp.model_dump_json(), media_type="application/json")
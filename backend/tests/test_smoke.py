@@ -20,3 +20,44 @@ def test_design_storm():
     assert r.status_code == 200
     data = r.json()
     assert len(data["time_minutes"]) > 0
+
+def test_timeseries_extract():
+    payload = {
+        "timestamps": ["2025-01-01T00:00:00", "2025-01-01T00:05:00", "2025-01-01T00:20:00"],
+        "values": [1, 3, 5],
+        "resample_minutes": 15,
+        "agg": "mean",
+    }
+    r = client.post("/api/timeseries/extract", json=payload)
+    assert r.status_code == 200
+    data = r.json()
+    assert data["timestamps"] == ["2025-01-01T00:00:00", "2025-01-01T00:15:00"]
+    assert data["values"] == [2.0, 5.0]
+
+def test_timeseries_extract_empty_bins():
+    payload = {
+        "timestamps": ["2025-01-01T00:00:00", "2025-01-01T00:40:00"],
+        "values": [1, 2],
+        "resample_minutes": 15,
+    }
+    r = client.post("/api/timeseries/extract", json=payload)
+    assert r.status_code == 200
+    assert r.json()["values"] == [1.0, None, 2.0]
+
+def test_timeseries_extract_isoformat_fallback():
+    # NaT (e.g. a trailing comma in the UI) and sub-second stamps take the
+    # per-element isoformat path.
+    payload = {
+        "timestamps": ["2025-01-01T00:00:00.250000", "2025-01-01T00:40:00.000000", ""],
+        "values": [1, 2, 0],
+        "resample_minutes": None,
+    }
+    r = client.post("/api/timeseries/extract", json=payload)
+    assert r.status_code == 200
+    assert r.json()["timestamps"] == ["2025-01-01T00:00:00.250000", "2025-01-01T00:40:00", "NaT"]
+
+def test_timeseries_extract_non_iso_timestamps():
+    payload = {"timestamps": ["1/2/2025 00:00", "1/2/2025 00:20"], "values": [1, 2], "resample_minutes": None}
+    r = client.post("/api/timeseries/extract", json=payload)
+    assert r.status_code == 200
+    assert r.json()["timestamps"] == ["2025-01-02T00:00:00", "2025-01-02T00:20:00"]
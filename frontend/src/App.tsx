@@ -1,7 +1,10 @@
-import React, { useState } from "react";
+import React, { Suspense, lazy, useState } from "react";
 import PercentCapture from "./pages/PercentCapture";
-import DesignStorm from "./pages/DesignStorm";
-import TimeseriesExtract from "./pages/TimeseriesExtract";
+
+// Chart pages pull in recharts; load them on first visit so the default
+// Percent Capture page doesn't pay for it at startup.
+const DesignStorm = lazy(() => import("./pages/DesignStorm"));
+const TimeseriesExtract = lazy(() => import("./pages/TimeseriesExtract"));
 
 type Page = "percent" | "storm" | "extract";
 
@@ -18,9 +21,11 @@ export default function App() {
         </nav>
       </header>
       <main>
-        {page === "percent" && <PercentCapture />}
-        {page === "storm" && <DesignStorm />}
-        {page === "extract" && <TimeseriesExtract />}
+        <Suspense fallback={<div className="card text-sm text-gray-500">Loading…</div>}>
+          {page === "percent" && <PercentCapture />}
+          {page === "storm" && <DesignStorm />}
+          {page === "extract" && <TimeseriesExtract />}
+        </Suspense>
       </main>
       <footer className="mt-10 text-xs text-gray-500">Built with FastAPI + React + Tailwind. Swap stub math for your production logic.</footer>
     </div>
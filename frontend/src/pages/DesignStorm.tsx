@@ -1,8 +1,13 @@
-import React, { useState } from "react";
+import React, { useMemo, useRef, useState } from "react";
 import { LineChart, Line, XAxis, YAxis, Tooltip, CartesianGrid } from "recharts";
 
 type Resp = { time_minutes: number[]; incremental_inches: number[]; cumulative_inches: number[]; };
 
+// The generator is deterministic, so a repeated parameter set (e.g. toggling
+// back to an earlier storm) reuses its response instead of another round trip.
+const CACHE_SIZE = 32;
+const responseCache = new Map<string, Resp>();
+
 export default function DesignStorm() {
   const [duration, setDuration] = useState(360);
   const [dt, setDt] = useState(5);
@@ -10,25 +15,51 @@ export default function DesignStorm() {
   const [peakFrac, setPeakFrac] = useState(0.35);
   const [sharp, setSharp] = useState(6.0);
   const [resp, setResp] = useState<Resp | null>(null);
+  const inflight = useRef<AbortController | null>(null);
 
   const run = async () => {
-    const r = await fetch("/api/design-storm/generate", {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({
-        duration_minutes: duration,
-        dt_minutes: dt,
-        total_depth_inches: depth,
-        peak_fraction_time: peakFrac,
-        sharpness: sharp,
-      }),
+    // A newer click supersedes any request still in flight.
+    inflight.current?.abort();
+    const ctrl = new AbortController();
+    inflight.current = ctrl;
+    const body = JSON.stringify({
+      duration_minutes: duration,
+      dt_minutes: dt,
+      total_depth_inches: depth,
+      peak_fraction_time: peakFrac,
+      sharpness: sharp,
     });
-    setResp(await r.json());
+    const cached = responseCache.get(body);
+    if (cached) {
+      setResp(cached);
+      return;
+    }
+    try {
+      const r = await fetch("/api/design-storm/generate", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body,
+        signal: ctrl.signal,
+      });
+      const j: Resp = await r.json();
+      if (r.ok) {
+        responseCache.set(body, j);
+        if (responseCache.size > CACHE_SIZE) {
+          responseCache.delete(responseCache.keys().next().value as string);
+        }
+      }
+      setResp(j);
+    } catch (e) {
+      if ((e as Error).name === "AbortError") return;
+      throw e;
+    }
   };
 
-  const data = resp?.time_minutes.map((t, i) => ({
+  // Only rebuild chart rows when a new response arrives, not on every
+  // keystroke in the parameter inputs.
+  const data = useMemo(() => resp?.time_minutes.map((t, i) => ({
     t, inc: resp.incremental_inches[i], cum: resp.cumulative_inches[i]
-  })) ?? [];
+  })) ?? [], [resp]);
 
   return (
     <div className="card">
@@ -50,7 +81,7 @@ export default function DesignStorm() {
             <XAxis dataKey="t" label={{ value: "min", position: "insideBottom", offset: -4 }} />
             <YAxis />
             <Tooltip />
-            <Line type="monotone" dataKey="inc" dot={false} />
+            <Line type="monotone" dataKey="inc" dot={false} isAnimationActive={false} />
           </LineChart>
         </div>
         <div className="card">
@@ -60,7 +91,7 @@ export default function DesignStorm() {
             <XAxis dataKey="t" label={{ value: "min", position: "insideBottom", offset: -4 }} />
             <YAxis />
             <Tooltip />
-            <Line type="monotone" dataKey="cum" dot={false} />
+            <Line type="monotone" dataKey="cum" dot={false} isAnimationActive={false} />
           </LineChart>
         </div>
       </div>
@@ -1,23 +1,34 @@
-import React, { useState } from "react";
+import React, { useRef, useState } from "react";
 
 export default function PercentCapture() {
   const [inflow, setInflow] = useState("1,2,3,4,5,6");
   const [captured, setCaptured] = useState("1,2,3,3,4,5");
   const [dt, setDt] = useState(15);
   const [result, setResult] = useState<any>(null);
+  const inflight = useRef<AbortController | null>(null);
 
   const run = async () => {
+    // A newer click supersedes any request still in flight.
+    inflight.current?.abort();
+    const ctrl = new AbortController();
+    inflight.current = ctrl;
     const body = {
       inflow: inflow.split(",").map((x) => Number(x.trim())),
       captured: captured.split(",").map((x) => Number(x.trim())),
       timestep_minutes: dt,
     };
-    const r = await fetch("/api/percent-capture/compute", {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(body),
-    });
-    setResult(await r.json());
+    try {
+      const r = await fetch("/api/percent-capture/compute", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(body),
+        signal: ctrl.signal,
+      });
+      setResult(await r.json());
+    } catch (e) {
+      if ((e as Error).name === "AbortError") return;
+      throw e;
+    }
   };
 
   return (
@@ -1,27 +1,73 @@
-import React, { useState } from "react";
+import React, { useRef, useState } from "react";
 import { LineChart, Line, XAxis, YAxis, Tooltip, CartesianGrid } from "recharts";
 
+type Point = { t: string; v: number | null };
+
+// The chart is 800px wide; beyond ~2 points per pixel extra samples only
+// grow the SVG path without changing what is drawn.
+const MAX_POINTS = 1600;
+
+// Min/max decimation: keep the lowest and highest sample of each bucket so
+// peaks survive while the plotted point count stays bounded. A bucket that
+// contains a null (empty resample bin) also keeps its first null so the
+// chart still draws the gap instead of bridging it.
+function decimate(rows: Point[], maxPoints: number): Point[] {
+  if (rows.length <= maxPoints) return rows;
+  const buckets = Math.floor(maxPoints / 2);
+  const size = rows.length / buckets;
+  const out: Point[] = [];
+  for (let b = 0; b < buckets; b++) {
+    const start = Math.floor(b * size);
+    const end = Math.min(rows.length, Math.floor((b + 1) * size));
+    let lo = -1, hi = -1, gap = -1;
+    for (let i = start; i < end; i++) {
+      const v = rows[i].v;
+      if (v === null) {
+        if (gap < 0) gap = i;
+        continue;
+      }
+      if (lo < 0 || v < (rows[lo].v as number)) lo = i;
+      if (hi < 0 || v > (rows[hi].v as number)) hi = i;
+    }
+    const keep = Array.from(new Set([lo, hi, gap].filter((i) => i >= 0))).sort((a, b) => a - b);
+    for (const i of keep) out.push(rows[i]);
+  }
+  return out;
+}
+
 export default function TimeseriesExtract() {
   const [timestamps, setTimestamps] = useState("2025-01-01T00:00:00,2025-01-01T00:05:00,2025-01-01T00:10:00,2025-01-01T00:15:00");
   const [values, setValues] = useState("1,2,3,2");
   const [res, setRes] = useState(15);
   const [agg, setAgg] = useState("mean");
-  const [data, setData] = useState<any[]>([]);
+  const [data, setData] = useState<Point[]>([]);
+  const inflight = useRef<AbortController | null>(null);
 
   const run = async () => {
+    // A newer click supersedes any request still in flight.
+    inflight.current?.abort();
+    const ctrl = new AbortController();
+    inflight.current = ctrl;
     const body = {
       timestamps: timestamps.split(",").map(s => s.trim()),
       values: values.split(",").map(s => Number(s.trim())),
       resample_minutes: res,
       agg
     };
-    const r = await fetch("/api/timeseries/extract", {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(body),
-    });
-    const j = await r.json();
-    setData(j.timestamps.map((t: string, i: number) => ({ t, v: j.values[i] })));
+    try {
+      const r = await fetch("/api/timeseries/extract", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(body),
+        signal: ctrl.signal,
+      });
+      const j = await r.json();
+      const rows: Point[] = j.timestamps.map((t: string, i: number) => ({ t, v: j.values[i] }));
+      setData(decimate(rows, MAX_POINTS));
+    } catch (e) {
+      if ((e as Error).name === "AbortError") return;
+      throw e;
+    }
   };
 
   return (
@@ -54,7 +100,7 @@ export default function TimeseriesExtract() {
           <XAxis dataKey="t" />
           <YAxis />
           <Tooltip />
-          <Line type="monotone" dataKey="v" dot={false} />
+          <Line type="monotone" dataKey="v" dot={false} isAnimationActive={false} />
         </LineChart>
       </div>
     </div>
@@ -9,12 +9,18 @@ exported to JSON with per-meter start/end information to enable analysis of
 meter specific dry weather flow (DWF) durations.
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, Iterable, List, Tuple, Optional
 import json
 
 
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if isinstance(value, datetime) else None
+
+
 @dataclass
 class MeterEvent:
     """Per-meter information for an event.
@@ -54,16 +60,13 @@ class DryEvent:
     def to_dict(self) -> dict:
         """Return a JSON serialisable dictionary for the event."""
 
-        def ts(value: Optional[datetime]) -> Optional[str]:
-            return value.isoformat() if isinstance(value, datetime) else None
-
         return {
-            "start": ts(self.start),
-            "end": ts(self.end),
+            "start": _isoformat(self.start),
+            "end": _isoformat(self.end),
             "meters": {
                 meter: {
-                    "start": ts(info.start),
-                    "end": ts(info.end),
+                    "start": _isoformat(info.start),
+                    "end": _isoformat(info.end),
                     "volume": info.volume,
                 }
                 for meter, info in self.meter_info.items()
@@ -119,7 +122,7 @@ def detect_dry_weather_periods(
     if not all_events:
         return []
 
-    all_events.sort(key=lambda ev: ev[0])
+    all_events.sort(key=itemgetter(0))
     merged: List[Tuple[datetime, datetime]] = []
     for start, end in all_events:
         if not merged:
@@ -154,24 +157,28 @@ def detect_dry_weather_periods(
     }
 
     sorted_series: Dict[str, List[Tuple[datetime, float]]] = {
-        m: sorted(list(s)) for m, s in meter_series.items()
+        m: sorted(s) for m, s in meter_series.items()
     }
 
-    for start, end in dry_gaps:
-        for meter, series in sorted_series.items():
+    for meter, series in sorted_series.items():
+        periods = meter_periods[meter]
+        trim = trim_start and bool(series)
+        base = base_flows.get(meter, 0.0)
+        times = [ts for ts, _ in series] if trim else []
+        for start, end in dry_gaps:
             m_start = start
-            if trim_start and series:
-                base = base_flows.get(meter, 0.0)
-                for ts, flow in series:
-                    if ts < start:
-                        continue
+            if trim:
+                # Jump straight to the first sample inside the gap rather
+                # than scanning the series from the beginning each time.
+                for i in range(bisect_left(times, start), len(series)):
+                    ts, flow = series[i]
                     if ts > end:
                         break
                     if flow <= base:
                         m_start = ts
                         break
 
-            meter_periods[meter].append((m_start, end))
+            periods.append((m_start, end))
 
     # Merge per-meter periods into DryEvent objects.
     return detect_dry_events(meter_periods)
@@ -249,15 +256,24 @@ def populate_meter_info(
     base_flow`` values are accumulated.
     """
 
-    series = {m: sorted(list(s)) for m, s in meter_series.items()}
+    # Everything that depends only on the meter is prepared once up front:
+    # the sorted series, its timestamps (so each event can slice its window
+    # by bisection instead of filtering the whole series) and the base flow.
+    prepared: Dict[str, Tuple[List[Tuple[datetime, float]], List[datetime], float]] = {}
+    for meter, s in meter_series.items():
+        series = sorted(s)
+        times = [ts for ts, _ in series]
+        prepared[meter] = (series, times, base_flows.get(meter, 0.0))
 
     for event in events:
         for meter, info in event.meter_info.items():
-            if meter not in series:
+            if meter not in prepared:
                 continue
 
-            base = base_flows.get(meter, 0.0)
-            readings = [r for r in series[meter] if info.start <= r[0] <= info.end]
+            series, times, base = prepared[meter]
+            lo = bisect_left(times, info.start)
+            hi = bisect_right(times, info.end)
+            readings = series[lo:hi]
             if len(readings) < 2:
                 info.volume = 0.0
                 continue
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+from hh_tools.event_extractor import (
+    DryEvent,
+    MeterEvent,
+    detect_dry_weather_periods,
+    populate_meter_info,
+)
+
+T0 = datetime(2024, 1, 1)
+
+
+def h(hours):
+    return T0 + timedelta(hours=hours)
+
+
+# A single dry gap from 1h to 10h between two rainfall events.
+RAIN = {"g1": [(h(0), h(1)), (h(10), h(11))]}
+
+
+def trimmed_start(series, base=1.0):
+    events = detect_dry_weather_periods(RAIN, {"m": series}, {"m": base}, trim_start=True)
+    assert len(events) == 1
+    return events[0].meter_info["m"].start
+
+
+def test_trim_reading_on_gap_start():
+    series = [(h(0), 0.0), (h(1), 0.5), (h(2), 0.2)]
+    assert trimmed_start(series) == h(1)
+
+
+def test_trim_reading_on_gap_end():
+    series = [(h(0), 0.0), (h(5), 3.0), (h(10), 0.5), (h(11), 0.1)]
+    assert trimmed_start(series) == h(10)
+
+
+def test_trim_duplicate_timestamps():
+    series = [(h(3), 5.0), (h(3), 0.5), (h(2), 4.0)]
+    assert trimmed_start(series) == h(3)
+    series = [(h(3), 5.0), (h(3), 4.0), (h(4), 0.5)]
+    assert trimmed_start(series) == h(4)
+
+
+def test_trim_without_sample_at_base_keeps_gap_start():
+    series = [(h(0), 0.0), (h(2), 3.0), (h(5), 2.0), (h(12), 0.0)]
+    assert trimmed_start(series) == h(1)
+
+
+def volume(series, start, end, base=1.0):
+    event = DryEvent(start=start, end=end, meter_info={"m": MeterEvent(start=start, end=end)})
+    populate_meter_info([event], {"m": series}, {"m": base})
+    return event.meter_info["m"].volume
+
+
+def test_volume_window_inclusive_at_both_ends():
+    series = [(h(0), 50.0), (h(1), 2.0), (h(2), 3.0), (h(3), 10.0), (h(4), 50.0)]
+    assert volume(series, h(1), h(3)) == (1.0 + 2.0) * 3600
+
+
+def test_volume_duplicate_timestamps_on_boundaries():
+    series = [(h(3), 7.0), (h(1), 4.0), (h(2), 1.0), (h(1), 2.0), (h(3), 5.0)]
+    assert volume(series, h(1), h(3)) == 3.0 * 3600
+
+
+def test_volume_needs_two_readings():
+    series = [(h(0), 5.0), (h(2), 5.0), (h(4), 5.0)]
+    assert volume(series, h(1), h(3)) == 0.0